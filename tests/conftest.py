@@ -1,13 +1,25 @@
-"""Pytest fixtures for all tests."""
+"""Pytest fixtures for all tests.
+
+Session-scoped fixture values are shared across the test session - (deep) copy them
+before mutating them.
+"""
 
 from __future__ import annotations
 
+from copy import deepcopy
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+import yaml
+
+try:
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:  # pragma: no cover
+    # PyYAML was built without libyaml
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore[assignment]
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from typing import Any, Union
 
 
@@ -17,12 +29,15 @@ def static_folder() -> Path:
     This is here to support _generate_entity_test_cases() in
     tests/oteapi_plugin/test_soft7_function.py.
     """
-    from pathlib import Path
-
     return Path(__file__).resolve().parent.resolve() / "static"
 
 
-@pytest.fixture(name="static_folder")
+def load_yaml_file(path: Path) -> Any:
+    """Load a YAML file."""
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=YAMLSafeLoader)
+
+
+@pytest.fixture(scope="session", name="static_folder")
 def static_folder_fixture() -> Path:
     """Path to the 'static' folder."""
     path = static_folder()
@@ -33,21 +48,29 @@ def static_folder_fixture() -> Path:
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def soft_datasource_content_url(static_folder: Path) -> str:
+    """File URL to the data source content YAML file represented by the
+    `soft_datasource_init` fixture."""
+    return (static_folder / "soft_datasource_content.yaml").as_uri()
+
+
+@pytest.fixture(scope="session")
 def soft_entity_init_source(static_folder: Path) -> Path:
     """Source to the SOFT7 entity YAML file used in the `soft_entity_init` fixture."""
     return static_folder / "soft_datasource_entity.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def soft_entity_init(
     soft_entity_init_source: Path,
 ) -> dict[str, Union[str, dict[str, Any]]]:
-    """A dict for initializing a `SOFT7Entity`."""
-    import yaml
+    """A dict for initializing a `SOFT7Entity`.
 
+    Use `soft_entity_init_mutable` for a copy that is safe to mutate.
+    """
     assert soft_entity_init_source.exists()
-    entity = yaml.safe_load(soft_entity_init_source.read_text(encoding="utf-8"))
+    entity = load_yaml_file(soft_entity_init_source)
 
     # entity should be parsed as a dict.
     assert isinstance(entity, dict)
@@ -56,16 +79,22 @@ def soft_entity_init(
 
 
 @pytest.fixture
+def soft_entity_init_mutable(
+    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+) -> dict[str, Union[str, dict[str, Any]]]:
+    """A private (deep) copy of `soft_entity_init`, which is safe to mutate."""
+    return deepcopy(soft_entity_init)
+
+
+@pytest.fixture(scope="session")
 def soft_datasource_entity_mapping_init(
-    static_folder: Path,
+    soft_datasource_content_url: str,
 ) -> dict[str, dict[str, str] | list[tuple[str, str, str]]]:
     """A dict representing a mapping used for a SOFT7DataSource based on the
     `SOFT7Entity` given in the `soft_entity_init()` fixture."""
     return {
         "prefixes": {
-            "data_source": (
-                f"{(static_folder / 'soft_datasource_content.yaml').as_uri()}#"
-            ),
+            "data_source": f"{soft_datasource_content_url}#",
             "s7_entity": "http://onto-ns.com/s7/0.1.0/MolecularSpecies#",
         },
         "triples": [
@@ -80,20 +109,33 @@ def soft_datasource_entity_mapping_init(
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def soft_datasource_mapping_config(
+    soft_datasource_entity_mapping_init: dict[
+        str, dict[str, str] | list[tuple[str, str, str]]
+    ],
+) -> dict[str, Any]:
+    """A dict representing the OTEAPI mapping configuration for a SOFT7DataSource based
+    on the mapping given in the `soft_datasource_entity_mapping_init()` fixture."""
+    return {"mappingType": "triples", **soft_datasource_entity_mapping_init}
+
+
+@pytest.fixture(scope="session")
 def soft_datasource_init(static_folder: Path) -> dict[str, Any]:
     """A dict representating data source content."""
-    import yaml
 
     def _list_to_tuple(value: Any) -> tuple[Any, ...]:
-        """Convert a list to a tuple."""
-        if isinstance(value, list):
-            return tuple(_list_to_tuple(_) for _ in value)
+        """Convert a (nested) list to a (nested) tuple.
+
+        YAML only ever produces plain lists, so an exact type check suffices.
+        """
+        if type(value) is list:
+            return tuple(map(_list_to_tuple, value))
         return value
 
     test_data_path = static_folder / "soft_datasource_content.yaml"
     assert test_data_path.exists()
-    test_data = yaml.safe_load(test_data_path.read_text(encoding="utf-8"))
+    test_data = load_yaml_file(test_data_path)
 
     # test_data should be parsed as a dict.
     assert isinstance(test_data, dict)
@@ -104,13 +146,15 @@ def soft_datasource_init(static_folder: Path) -> dict[str, Any]:
     assert test_data["properties"]
 
     # Convert all property values to the correct type.
-    for property_name, property_value in list(test_data["properties"].items()):
-        test_data["properties"][property_name] = _list_to_tuple(property_value)
+    test_data["properties"] = {
+        property_name: _list_to_tuple(property_value)
+        for property_name, property_value in test_data["properties"].items()
+    }
 
     return test_data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def soft_instance_data_source(static_folder: Path) -> Path:
     """Source to the SOFT7 instance data YAML file used in the `soft_instance_data`
     fixture.
@@ -118,16 +162,12 @@ def soft_instance_data_source(static_folder: Path) -> Path:
     return static_folder / "soft_datasource_entity_test_data.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def soft_instance_data(soft_instance_data_source: Path) -> dict[str, dict[str, Any]]:
     """A dict for initializing a `SOFT7Instance` based on the entity expressed in the
     `soft_entity_init` fixture."""
-    import yaml
-
     assert soft_instance_data_source.exists()
-    instance_data = yaml.safe_load(
-        soft_instance_data_source.read_text(encoding="utf-8")
-    )
+    instance_data = load_yaml_file(soft_instance_data_source)
 
     # instance_data should be parsed as a dict.
     assert isinstance(instance_data, dict)
@@ -135,31 +175,43 @@ def soft_instance_data(soft_instance_data_source: Path) -> dict[str, dict[str, A
     return instance_data
 
 
-@pytest.fixture
-def soft_datasource_configs(
-    static_folder: Path,
+@pytest.fixture(scope="session")
+def soft_datasource_pipeline_configs(
     soft_entity_init: dict[str, Union[str, dict[str, Any]]],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
+    soft_datasource_content_url: str,
+    soft_datasource_mapping_config: dict[str, Any],
 ) -> dict[str, dict[str, Any]]:
-    """A dict representing the configurations for a SOFT7DataSource."""
-    from s7.pydantic_models.oteapi import default_soft7_ote_function_config
+    """The OTEAPI configurations for creating a SOFT7 data source from the static test
+    data, using the default SOFT7 function configuration.
 
+    `create_datasource()` updates the given configs in-place, so pass a (shallow)
+    copy of it.
+    """
     return {
         "dataresource": {
             "resourceType": "resource/url",
-            "downloadUrl": (static_folder / "soft_datasource_content.yaml").as_uri(),
+            "downloadUrl": soft_datasource_content_url,
             "mediaType": "application/yaml",
         },
         "parser": {
             "parserType": "parser/yaml",
             "entity": soft_entity_init["identity"],
         },
-        "mapping": {
-            "mappingType": "triples",
-            **soft_datasource_entity_mapping_init,
-        },
+        "mapping": soft_datasource_mapping_config,
+    }
+
+
+@pytest.fixture
+def soft_datasource_configs(
+    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """A dict representing the configurations for a SOFT7DataSource, i.e., the
+    `soft_datasource_pipeline_configs` with an explicit SOFT7 function configuration."""
+    from s7.pydantic_models.oteapi import default_soft7_ote_function_config
+
+    return {
+        **soft_datasource_pipeline_configs,
         "function": default_soft7_ote_function_config(
             soft_entity_init["identity"]
         ).model_dump(mode="json"),
@@ -2,8 +2,46 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+    from typing import Any, Callable, Union
+
+    from pytest_httpx import HTTPXMock
+    from requests_mock import Mocker
+
+    from s7.pydantic_models.datasource import SOFT7DataSource
+
+
+@contextmanager
+def _mock_entity_identity(
+    entity: dict[str, Union[str, dict[str, Any]]],
+) -> Iterator[None]:
+    """Mock HTTP GET requests for the SOFT7 entity identity.
+
+    For use in fixtures with a broader scope than the function-scoped `httpx_mock`
+    fixture.
+    """
+    import httpx
+
+    def _handle_request(
+        _: httpx.HTTPTransport, request: httpx.Request
+    ) -> httpx.Response:
+        """Return the entity for its identity URL."""
+        assert (
+            str(request.url) == entity["identity"]
+        ), f"Unexpected HTTP request to {request.url}"
+        return httpx.Response(200, json=entity)
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(httpx.HTTPTransport, "handle_request", _handle_request)
+        yield
+
 
 @pytest.fixture(scope="session", autouse=True)
 def _load_strategies() -> None:
@@ -13,9 +51,221 @@ def _load_strategies() -> None:
     load_strategies(test_for_uniqueness=False)
 
 
-@pytest.fixture(autouse=True)
-def _clear_cache() -> None:
-    """Clear the cache before each test."""
+@pytest.fixture
+def clear_datasource_cache() -> None:
+    """Clear the data source pipeline cache.
+
+    Request this fixture in tests that depend on a cold cache, e.g., ensuring the
+    OTEAPI pipeline is run.
+    """
     from s7.factories.datasource_factory import CACHE
 
     CACHE.clear()
+
+
+@pytest.fixture(scope="session")
+def soft_datasource_json_schema(static_folder: Path) -> dict[str, Any]:
+    """The expected JSON Schema for the SOFT7 data source created from the static test
+    data."""
+    import json
+
+    return json.loads(
+        (static_folder / "soft_datasource_json_schema.json").read_text(encoding="utf-8")
+    )
+
+
+@pytest.fixture(scope="session")
+def oteapi_url() -> str:
+    """The base URL, including the REST API prefix, of the mocked OTEAPI Service."""
+    from otelib.settings import Settings
+
+    default_oteapi_url = "http://localhost:8080"
+    return f"{default_oteapi_url}{Settings().prefix}"
+
+
+@pytest.fixture(scope="session")
+def soft7_function_get_content(
+    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+    soft_datasource_init: dict[str, Any],
+    soft_datasource_entity_mapping_init: dict[
+        str, Union[dict[str, str], list[tuple[str, str, str]]]
+    ],
+) -> dict[str, Any]:
+    """The content returned from the SOFT7 function strategy's `get()` method, when
+    run as the final step of the pipeline:
+
+        dataresource >> parser >> mapping >> function
+
+    """
+    import json
+
+    from s7.oteapi_plugin.soft7_function import SOFT7Generator
+
+    # Mock the session data content for the pipeline, and add the generator
+    # configuration
+    configuration = dict(soft_datasource_entity_mapping_init)
+    configuration["content"] = soft_datasource_init
+    configuration["entity"] = soft_entity_init["identity"]
+
+    with _mock_entity_identity(soft_entity_init):
+        function_get_content = SOFT7Generator(
+            function_config={"functionType": "SOFT7", "configuration": configuration}
+        ).get()
+
+    return json.loads(function_get_content.model_dump_json())
+
+
+@pytest.fixture(scope="session")
+def oteapi_service_routes(
+    oteapi_url: str,
+    soft_datasource_init: dict[str, Any],
+    soft_datasource_entity_mapping_init: dict[
+        str, Union[dict[str, str], list[tuple[str, str, str]]]
+    ],
+) -> tuple[tuple[str, str, dict[str, Any]], ...]:
+    """The `(method, URL, response)` of the mocked OTEAPI Service routes used when
+    running the OTE pipeline:
+
+        dataresource >> parser >> mapping >> function
+
+    All routes are included, except the function strategy's `get()` route.
+    The response contents are serialized once per test session.
+    """
+    import json
+
+    empty_json_content = b"{}"
+
+    return (
+        # Creating strategies
+        ("POST", f"{oteapi_url}/dataresource", {"json": {"resource_id": "1234"}}),
+        ("POST", f"{oteapi_url}/parser", {"json": {"parser_id": "1234"}}),
+        ("POST", f"{oteapi_url}/mapping", {"json": {"mapping_id": "1234"}}),
+        ("POST", f"{oteapi_url}/function", {"json": {"function_id": "1234"}}),
+        # Create session
+        ("POST", f"{oteapi_url}/session", {"text": '{"session_id": "1234"}'}),
+        # Initialize
+        (
+            "POST",
+            f"{oteapi_url}/function/1234/initialize",
+            {"content": empty_json_content},
+        ),
+        (
+            "POST",
+            f"{oteapi_url}/mapping/1234/initialize",
+            {
+                "content": json.dumps(soft_datasource_entity_mapping_init).encode(
+                    encoding="utf-8"
+                )
+            },
+        ),
+        (
+            "POST",
+            f"{oteapi_url}/parser/1234/initialize",
+            {"content": empty_json_content},
+        ),
+        (
+            "POST",
+            f"{oteapi_url}/dataresource/1234/initialize",
+            {"content": empty_json_content},
+        ),
+        # Fetch
+        (
+            "GET",
+            f"{oteapi_url}/dataresource/1234",
+            {"content": b'{"key": "test"}'},
+        ),
+        (
+            "GET",
+            f"{oteapi_url}/parser/1234",
+            {
+                "content": json.dumps({"content": soft_datasource_init}).encode(
+                    encoding="utf-8"
+                )
+            },
+        ),
+        ("GET", f"{oteapi_url}/mapping/1234", {"content": empty_json_content}),
+    )
+
+
+@pytest.fixture
+def mock_oteapi_service(
+    oteapi_url: str,
+    oteapi_service_routes: tuple[tuple[str, str, dict[str, Any]], ...],
+    requests_mock: Mocker,
+) -> Callable[[dict[str, Any]], None]:
+    """Mock the OTEAPI Service routes used when running the OTE pipeline:
+
+        dataresource >> parser >> mapping >> function
+
+    Returns a function to register all routes, taking the content to be returned from
+    the function strategy's `get()` route.
+    """
+    import json
+
+    def _register_routes(function_get_content: dict[str, Any]) -> None:
+        """Register all mocked OTEAPI Service routes."""
+        for method, url, response in oteapi_service_routes:
+            requests_mock.register_uri(method, url, **response)
+
+        requests_mock.get(
+            f"{oteapi_url}/function/1234",
+            content=json.dumps(function_get_content).encode(encoding="utf-8"),
+        )
+
+    return _register_routes
+
+
+@pytest.fixture(scope="session")
+def built_datasource(
+    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+) -> SOFT7DataSource:
+    """A SOFT7 data source created from the static test data using the Python OTEAPI
+    pipeline.
+
+    Only use it in tests that inspect the data source. Use `unresolved_datasource` for
+    tests that resolve its fields.
+
+    All the data source's fields are resolved upon creation, hence no HTTP requests need
+    to be mocked when using it.
+    """
+    from s7.factories.datasource_factory import create_datasource
+
+    with _mock_entity_identity(soft_entity_init):
+        datasource = create_datasource(
+            entity=soft_entity_init,
+            configs=dict(soft_datasource_pipeline_configs),
+            oteapi_url="python",
+        )
+
+        # Resolve all fields while the HTTP requests are mocked
+        datasource.model_dump()
+
+    return datasource
+
+
+@pytest.fixture
+def unresolved_datasource(
+    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+    httpx_mock: HTTPXMock,
+) -> SOFT7DataSource:
+    """A new SOFT7 data source created from the static test data using the Python
+    OTEAPI pipeline, with none of its fields resolved yet."""
+    from s7.factories.datasource_factory import create_datasource
+
+    # Mock SOFT7Entity identity URL
+    # Only requested if the OTEAPI pipeline is run, i.e., if the data source cache is
+    # cold.
+    httpx_mock.add_response(
+        method="GET",
+        url=soft_entity_init["identity"],
+        json=soft_entity_init,
+        is_optional=True,
+    )
+
+    return create_datasource(
+        entity=soft_entity_init,
+        configs=dict(soft_datasource_pipeline_configs),
+        oteapi_url="python",
+    )
@@ -9,7 +9,7 @@ import pytest
 if TYPE_CHECKING:
     import sys
     from pathlib import Path
-    from typing import Any
+    from typing import Any, Callable
 
     if sys.version_info >= (3, 10):
         from typing import Literal
@@ -17,160 +17,63 @@ if TYPE_CHECKING:
         from typing_extensions import Literal
 
     from pytest_httpx import HTTPXMock
-    from requests_mock import Mocker
 
-
-pytestmark = pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+    from s7.pydantic_models.datasource import SOFT7DataSource
 
 
-def test_create_datasource(
-    soft_entity_init: dict[str, str | dict],
-    soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    requests_mock: Mocker,
-    httpx_mock: HTTPXMock,
-    static_folder: Path,
-) -> None:
-    """Test a straight forward call to create_datasource()."""
-    import json
+pytestmark = pytest.mark.httpx_mock(can_send_already_matched_responses=True)
 
-    from otelib.settings import Settings
+# The qualified name of the functions set as unresolved field values in a data source.
+GET_DATA_QUALNAME = "_get_data.<locals>.__get_data"
 
-    from s7.factories.datasource_factory import create_datasource
-    from s7.oteapi_plugin.soft7_function import SOFT7Generator
+# Expected values for the data source created from the static test data.
+# Checked against the `soft_entity_init`'s values - check the fixture for confirmation
+# that the content here matches the fixture.
+# The type of the properties are derived from the `soft_datasource_init` fixture, in
+# the sense of dimensionality, while the type of the dimensions is always `int`.
+EXPECTED_DATASOURCE_DOCSTRING = """MolecularSpecies
 
-    default_oteapi_url = "http://localhost:8080"
-    rest_api_prefix = Settings().prefix
+    A bare-bones entity for testing.
 
-    oteapi_url = f"{default_oteapi_url}{rest_api_prefix}"
+    SOFT7 Entity Metadata:
+        Identity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
 
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
+        Namespace: http://onto-ns.com/s7
+        Version: 0.1.0
+        Name: MolecularSpecies
 
-    # Run SOFT7Generator
-    # Mock the session data content for the
-    # pipeline = dataresource >> mapping >> function
-    session_data = {}
-    session_data.update(soft_datasource_entity_mapping_init)
-    session_data.update({"content": soft_datasource_init})
-    generator_configuration = {"entity": soft_entity_init["identity"]}
-    function_get_content = SOFT7Generator(
-        function_config={
-            "functionType": "SOFT7",
-            "configuration": {**session_data, **generator_configuration},
-        }
-    ).get()
-
-    # Creating strategies
-    # The data resource
-    requests_mock.post(
-        f"{oteapi_url}/dataresource",
-        json={"resource_id": "1234"},
-    )
+    Dimensions:
+        N (int): Number of elements.
 
-    # The parser resource
-    requests_mock.post(
-        f"{oteapi_url}/parser",
-        json={"parser_id": "1234"},
-    )
+    Attributes:
+        atom (tuple[str, str, str, str, str]): An atom.
+        electrons (tuple[int, int, int, int, int]): Number of electrons.
+        mass (tuple[float, float, float, float, float]): Atomic mass.
+        radius (tuple[float, float, float, float, float]): Atomic radius.
 
-    # The mapping
-    requests_mock.post(
-        f"{oteapi_url}/mapping",
-        json={"mapping_id": "1234"},
-    )
+    """
 
-    # The function
-    requests_mock.post(
-        f"{oteapi_url}/function",
-        json={"function_id": "1234"},
-    )
+EXPECTED_DIMENSIONS_DOCSTRING = """MolecularSpeciesDimensions
 
-    # Getting the OTE pipeline = dataresource >> mapping >> function
-    # Create session
-    requests_mock.post(
-        f"{oteapi_url}/session",
-        text=json.dumps({"session_id": "1234"}),
-    )
+    Dimensions for the MolecularSpecies SOFT7 data source.
 
-    # Initialize
-    requests_mock.post(
-        f"{oteapi_url}/function/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/mapping/1234/initialize",
-        content=json.dumps(soft_datasource_entity_mapping_init).encode(
-            encoding="utf-8"
-        ),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/parser/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/dataresource/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
+    SOFT7 Entity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
 
-    # Fetch
-    requests_mock.get(
-        f"{oteapi_url}/dataresource/1234",
-        content=json.dumps({"key": "test"}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/parser/1234",
-        content=json.dumps({"content": soft_datasource_init}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/mapping/1234",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/function/1234",
-        content=function_get_content.model_dump_json().encode(encoding="utf-8"),
-    )
+    Attributes:
+        N (int): Number of elements.
 
-    create_datasource(
-        entity=soft_entity_init["identity"],
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
-    )
+    """
 
 
-def test_inspect_created_datasource(
+@pytest.mark.usefixtures("clear_datasource_cache")
+def test_create_datasource(
     soft_entity_init: dict[str, str | dict],
-    static_folder: Path,
-    soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+    soft7_function_get_content: dict[str, Any],
+    mock_oteapi_service: Callable[[dict[str, Any]], None],
     httpx_mock: HTTPXMock,
 ) -> None:
-    """Test the generated data source contains the expected attributes and metadata."""
-    from pydantic import AnyHttpUrl, BaseModel
-
+    """Test a straight forward call to create_datasource()."""
     from s7.factories.datasource_factory import create_datasource
 
     # Mock SOFT7Entity identity URL
@@ -180,442 +83,137 @@ def test_inspect_created_datasource(
         json=soft_entity_init,
     )
 
-    datasource = create_datasource(
-        entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
-        oteapi_url="python",
-    )
+    # Mock the OTEAPI Service running the pipeline
+    mock_oteapi_service(soft7_function_get_content)
 
-    ## Check the special attributes set on the class are what we expect
-    # doc-string
-    # Checked against the `soft_entity_init`'s values - check the fixture for
-    # confirmation that the content here matches the fixture.
-    # The type of the properties are derived from the `soft_datasource_init` fixture,
-    # in the sense of dimensionality.
-    assert (
-        datasource.__doc__
-        == """MolecularSpecies
-
-    A bare-bones entity for testing.
-
-    SOFT7 Entity Metadata:
-        Identity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
-
-        Namespace: http://onto-ns.com/s7
-        Version: 0.1.0
-        Name: MolecularSpecies
+    create_datasource(
+        entity=soft_entity_init["identity"],
+        configs=dict(soft_datasource_pipeline_configs),
+    )
 
-    Dimensions:
-        N (int): Number of elements.
 
-    Attributes:
-        atom (tuple[str, str, str, str, str]): An atom.
-        electrons (tuple[int, int, int, int, int]): Number of electrons.
-        mass (tuple[float, float, float, float, float]): Atomic mass.
-        radius (tuple[float, float, float, float, float]): Atomic radius.
+def test_inspect_created_datasource(
+    built_datasource: SOFT7DataSource,
+    soft_entity_init: dict[str, str | dict],
+) -> None:
+    """Test the generated data source contains the expected attributes and metadata."""
+    from pydantic import AnyHttpUrl
 
-    """
-    )
+    ## Check the special attributes set on the class are what we expect
+    # doc-string
+    assert built_datasource.__doc__ == EXPECTED_DATASOURCE_DOCSTRING
 
     ## Check the data source's attribute values are currently (lambda) functions
-    # Get the data source's representation
-    datasource_repr = repr(datasource)
-
-    # Remove the class name and the surrounding parentheses
-    datasource_repr_fields = datasource_repr[
-        len(datasource.__class__.__name__) + 1 : -1
-    ]
+    for field_name in built_datasource.model_fields:
+        if field_name.startswith("soft7___"):
+            # Avoid checking metadata
+            continue
 
-    for field in datasource_repr_fields.split(", "):
-        field_name, field_value = field.split("=", maxsplit=1)
-        assert field_value.startswith("<function _get_data.<locals>.__get_data at"), (
+        field_value = built_datasource.__dict__[field_name]
+        assert getattr(field_value, "__qualname__", None) == GET_DATA_QUALNAME, (
             f"{field_name} is not a lambda function of "
             "`s7.factories.datasource_factory._get_data` and its inner function "
-            f"`__get_data`, it is a {field_value}."
+            f"`__get_data`, it is a {field_value!r}."
         )
 
-    ## Check the data source's data is correctly resolved
-    for field_name in datasource.model_fields:
+    ## Check the data source's metadata is correctly resolved
+    # identity, including the derived metadata: namespace, version, and name."
+    assert (
+        str(built_datasource.soft7___identity)
+        == soft_entity_init["identity"]
+        == "http://onto-ns.com/s7/0.1.0/MolecularSpecies"
+    )
+    assert built_datasource.soft7___namespace == AnyHttpUrl("http://onto-ns.com/s7")
+    assert built_datasource.soft7___version == "0.1.0"
+    assert built_datasource.soft7___name == "MolecularSpecies"
+
+
+def test_resolve_datasource_attributes(
+    unresolved_datasource: SOFT7DataSource,
+    soft_datasource_init: dict[str, Any],
+) -> None:
+    """Test the data source's data is correctly resolved through attribute access."""
+    for field_name in unresolved_datasource.model_fields:
         if field_name.startswith("soft7___"):
             # Avoid checking metadata
             continue
 
-        datasource_value = getattr(datasource, field_name)
+        datasource_value = getattr(unresolved_datasource, field_name)
 
         assert datasource_value == soft_datasource_init["properties"][field_name], (
             f"{field_name} is not correctly resolved, it is {datasource_value} and "
             f"should be {soft_datasource_init['properties'][field_name]}."
         )
 
-    ## Check the data source's metadata is correctly resolved
-    # identity, including the derived metadata: namespace, version, and name."
-    assert (
-        str(datasource.soft7___identity)
-        == soft_entity_init["identity"]
-        == "http://onto-ns.com/s7/0.1.0/MolecularSpecies"
-    )
-    assert datasource.soft7___namespace == AnyHttpUrl("http://onto-ns.com/s7")
-    assert datasource.soft7___version == "0.1.0"
-    assert datasource.soft7___name == "MolecularSpecies"
-
-    # dimensions
-    assert isinstance(datasource.soft7___dimensions, BaseModel)
 
-    dimensions_metadata = datasource.soft7___dimensions
-
-    # doc-string
-    # Checked against the `soft_entity_init`'s values - check the fixture for
-    # confirmation that the content here matches the fixture.
-    # The type of the dimensions is always `int`.
-    assert (
-        dimensions_metadata.__doc__
-        == """MolecularSpeciesDimensions
+def test_inspect_created_datasource_dimensions(
+    built_datasource: SOFT7DataSource,
+    soft_datasource_init: dict[str, Any],
+) -> None:
+    """Test the generated data source's dimensions metadata."""
+    from pydantic import BaseModel
 
-    Dimensions for the MolecularSpecies SOFT7 data source.
+    assert isinstance(built_datasource.soft7___dimensions, BaseModel)
 
-    SOFT7 Entity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
+    dimensions_metadata = built_datasource.soft7___dimensions
 
-    Attributes:
-        N (int): Number of elements.
+    # doc-string
+    assert dimensions_metadata.__doc__ == EXPECTED_DIMENSIONS_DOCSTRING
 
-    """
-    )
     # Check the dimensions values are currently (lambda) functions
-    # Get the dimensions' representation
-    dimensions_repr = repr(dimensions_metadata)
-
-    # Remove the class name and the surrounding parentheses
-    dimensions_repr_fields = dimensions_repr[
-        len(dimensions_metadata.__class__.__name__) + 1 : -1
-    ]
-
-    for field in dimensions_repr_fields.split(", "):
-        dimension_name, dimension_value = field.split("=", maxsplit=1)
-        assert dimension_value.startswith(
-            "<function _get_data.<locals>.__get_data at"
-        ), (
+    for dimension_name, dimension_info in dimensions_metadata.model_fields.items():
+        dimension_value = dimensions_metadata.__dict__[dimension_name]
+        assert getattr(dimension_value, "__qualname__", None) == GET_DATA_QUALNAME, (
             f"{dimension_name} is not a lambda function of "
             "`s7.factories.datasource_factory._get_data` and its inner function "
-            f"`__get_data`, it is a {dimension_value}."
+            f"`__get_data`, it is a {dimension_value!r}."
         )
 
-    # Check there are no excluded fields
-    assert len(dimensions_repr_fields.split(", ")) == len(
-        dimensions_metadata.model_fields
-    )
+        # Check the dimension is not excluded from the representation
+        assert dimension_info.repr, f"{dimension_name} is excluded from the repr."
 
     # Check the dimensions are correctly resolved
-    for dimension_name in dimensions_metadata.model_fields:
-        assert (
-            getattr(dimensions_metadata, dimension_name)
-            == soft_datasource_init["dimensions"][dimension_name]
-        ), (
-            f"{dimension_name} is not correctly resolved, it is "
-            f"{getattr(dimensions_metadata, dimension_name)} and should be "
-            f"{soft_datasource_init['dimensions'][dimension_name]}."
-        )
+    assert dimensions_metadata.model_dump() == soft_datasource_init["dimensions"]
 
 
 def test_serialize_python_datasource(
-    soft_entity_init: dict[str, str | dict],
+    unresolved_datasource: SOFT7DataSource,
     soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    httpx_mock: HTTPXMock,
-    static_folder: Path,
 ) -> None:
     """Check the data source contents when serialized to a Python dict."""
-    from s7.factories.datasource_factory import create_datasource
-
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
-
-    datasource = create_datasource(
-        entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
-        oteapi_url="python",
-    )
-
-    python_serialized = datasource.model_dump()
+    python_serialized = unresolved_datasource.model_dump()
 
     assert python_serialized == soft_datasource_init["properties"]
 
 
 def test_serialize_json_datasource(
-    soft_entity_init: dict[str, str | dict],
+    built_datasource: SOFT7DataSource,
     soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    httpx_mock: HTTPXMock,
-    static_folder: Path,
 ) -> None:
     """Check the data source contents when serialized to JSON."""
     import json
 
-    from s7.factories.datasource_factory import create_datasource
-
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
-
-    datasource = create_datasource(
-        entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
-        oteapi_url="python",
-    )
-
-    json_serialized = datasource.model_dump_json()
+    json_serialized = built_datasource.model_dump_json()
 
-    assert json_serialized == json.dumps(
-        soft_datasource_init["properties"], separators=(",", ":"), indent=None
+    # Normalize the expected values (e.g., tuples) to their JSON-parsed counterparts
+    assert json.loads(json_serialized) == json.loads(
+        json.dumps(soft_datasource_init["properties"])
     )
 
 
 def test_datasource_json_schema(
-    soft_entity_init: dict[str, str | dict],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    httpx_mock: HTTPXMock,
-    static_folder: Path,
+    built_datasource: SOFT7DataSource,
+    soft_datasource_json_schema: dict[str, Any],
 ) -> None:
     """Check the generated JSON Schema for the data source."""
-    from s7.factories.datasource_factory import create_datasource
+    json_schema = built_datasource.model_json_schema()
 
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
-
-    datasource = create_datasource(
-        entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
-        oteapi_url="python",
-    )
-
-    json_schema = datasource.model_json_schema()
-
-    assert json_schema == {
-        "title": "MolecularSpeciesDataSource",
-        "description": """MolecularSpecies
-
-A bare-bones entity for testing.
-
-SOFT7 Entity Metadata:
-    Identity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
-
-    Namespace: http://onto-ns.com/s7
-    Version: 0.1.0
-    Name: MolecularSpecies
-
-Dimensions:
-    N (int): Number of elements.
-
-Attributes:
-    atom (tuple[str, str, str, str, str]): An atom.
-    electrons (tuple[int, int, int, int, int]): Number of electrons.
-    mass (tuple[float, float, float, float, float]): Atomic mass.
-    radius (tuple[float, float, float, float, float]): Atomic radius.""",
-        "type": "object",
-        "properties": {
-            "atom": {
-                "title": "atom",
-                "type": "array",
-                "minItems": 5,
-                "maxItems": 5,
-                "prefixItems": [
-                    {"type": "string"},
-                    {"type": "string"},
-                    {"type": "string"},
-                    {"type": "string"},
-                    {"type": "string"},
-                ],
-                "description": "An atom.",
-                "x-soft7-shape": ["N"],
-            },
-            "electrons": {
-                "title": "electrons",
-                "type": "array",
-                "minItems": 5,
-                "maxItems": 5,
-                "prefixItems": [
-                    {"type": "integer"},
-                    {"type": "integer"},
-                    {"type": "integer"},
-                    {"type": "integer"},
-                    {"type": "integer"},
-                ],
-                "description": "Number of electrons.",
-                "x-soft7-shape": ["N"],
-            },
-            "mass": {
-                "title": "mass",
-                "type": "array",
-                "minItems": 5,
-                "maxItems": 5,
-                "prefixItems": [
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                ],
-                "description": "Atomic mass.",
-                "x-soft7-shape": ["N"],
-                "x-soft7-unit": "amu",
-            },
-            "radius": {
-                "title": "radius",
-                "type": "array",
-                "minItems": 5,
-                "maxItems": 5,
-                "prefixItems": [
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                    {"type": "number"},
-                ],
-                "description": "Atomic radius.",
-                "x-soft7-shape": ["N"],
-                "x-soft7-unit": "Å",
-            },
-            "soft7___dimensions": {
-                "$ref": "#/$defs/MolecularSpeciesDataSourceDimensions",
-                "default": {"N": 5},
-            },
-            "soft7___identity": {
-                "title": "Soft7   Identity",
-                "type": "string",
-                "format": "uri",
-                "minLength": 1,
-                "default": "http://onto-ns.com/s7/0.1.0/MolecularSpecies",
-            },
-            "soft7___namespace": {
-                "title": "Soft7   Namespace",
-                "type": "string",
-                "format": "uri",
-                "minLength": 1,
-                "default": "http://onto-ns.com/s7",
-            },
-            "soft7___version": {
-                "title": "Soft7   Version",
-                "default": "0.1.0",
-                "anyOf": [{"type": "string"}, {"type": "null"}],
-            },
-            "soft7___name": {
-                "title": "Soft7   Name",
-                "default": "MolecularSpecies",
-                "type": "string",
-            },
-        },
-        "$defs": {
-            "MolecularSpeciesDataSourceDimensions": {
-                "title": "MolecularSpeciesDataSourceDimensions",
-                "description": """MolecularSpeciesDimensions
-
-Dimensions for the MolecularSpecies SOFT7 data source.
-
-SOFT7 Entity: http://onto-ns.com/s7/0.1.0/MolecularSpecies
-
-Attributes:
-    N (int): Number of elements.""",
-                "type": "object",
-                "properties": {
-                    "N": {
-                        "title": "N",
-                        "description": "Number of elements.",
-                        "type": "integer",
-                    }
-                },
-                "additionalProperties": False,
-            }
-        },
-        "additionalProperties": False,
-    }
+    assert json_schema == soft_datasource_json_schema
 
 
 def test_cacheing_model_attribute_results(
     soft_entity_init: dict[str, str | dict],
-    static_folder: Path,
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
     httpx_mock: HTTPXMock,
 ) -> None:
     """Test the DataSource attribute results are cached in the model."""
@@ -624,32 +222,19 @@ def test_cacheing_model_attribute_results(
     from s7.factories.datasource_factory import create_datasource
 
     # Mock SOFT7Entity identity URL
+    # Only requested if the OTEAPI pipeline is run, i.e., if the data source cache is
+    # cold.
     httpx_mock.add_response(
         method="GET",
         url=soft_entity_init["identity"],
         json=soft_entity_init,
+        is_optional=True,
     )
 
     # Create the data source
     datasource = create_datasource(
         entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
+        configs=dict(soft_datasource_pipeline_configs),
         oteapi_url="python",
     )
 
@@ -661,28 +246,32 @@ def test_cacheing_model_attribute_results(
 
     # Get one of the datasource's attributes and check the cache
     assert len(datasource.model_fields) > 1
-    for attribute_name in datasource.model_fields:
-        if attribute_name.startswith("soft7___"):
-            continue
-        break
-    else:
-        pytest.fail("No 'proper' property could be found for datasource example.")
+    attribute_name = next(
+        (
+            field_name
+            for field_name in datasource.model_fields
+            if not field_name.startswith("soft7___")
+        ),
+        None,
+    )
+    assert (
+        attribute_name is not None
+    ), "No 'proper' property could be found for datasource example."
 
     attribute_value = getattr(datasource, attribute_name)
 
-    # Check the internal model cache has been populated with the attribute
-    assert datasource._resolved_fields
-    assert len(datasource._resolved_fields) == 1
-    assert attribute_name in datasource._resolved_fields
-    assert datasource._resolved_fields[attribute_name] == attribute_value
+    # Check the internal model cache has been populated with (only) the attribute
+    assert datasource._resolved_fields == {attribute_name: attribute_value}
 
 
+@pytest.mark.usefixtures("clear_datasource_cache")
 def test_pipeline_cache(
     soft_entity_init: dict[str, str | dict],
-    static_folder: Path,
+    soft_datasource_content_url: str,
     soft_datasource_entity_mapping_init: dict[
         str, dict[str, str] | list[tuple[str, str, str]]
     ],
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
     httpx_mock: HTTPXMock,
 ) -> None:
     """Test the pipeline cache functions as intended."""
@@ -702,29 +291,16 @@ def test_pipeline_cache(
     # Create the data source
     datasource = create_datasource(
         entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
+        configs=dict(soft_datasource_pipeline_configs),
         oteapi_url="python",
     )
 
     assert CACHE, json.dumps(CACHE, indent=2)
     assert len(CACHE) == 1, json.dumps(CACHE, indent=2)
 
+    # Snapshot the cache keys and the identity of the cached pipeline results
+    org_cache = {pipeline_id: id(result) for pipeline_id, result in CACHE.items()}
+
     # Check the cache is working as intended
     # Get the data source from the cache
     cached_datasource = next(iter(CACHE.values()))
@@ -734,51 +310,36 @@ def test_pipeline_cache(
     # properties
     assert "properties" in cached_datasource["soft7_entity_data"]
     assert isinstance(cached_datasource["soft7_entity_data"]["properties"], dict)
-    for name, value in cached_datasource["soft7_entity_data"]["properties"].items():
-        assert hasattr(datasource, name)
-        datasource_attribute_value = getattr(datasource, name)
-
-        # The datasource's values will be tuple if it has a shape
-        if isinstance(datasource_attribute_value, tuple):
-            assert list(datasource_attribute_value) == value
-        else:
-            assert datasource_attribute_value == value
+    # Serialize in JSON mode, since the datasource's values will be tuple if it has a
+    # shape, while the cached pipeline result is JSON-deserialized
+    assert (
+        datasource.model_dump(mode="json")
+        == cached_datasource["soft7_entity_data"]["properties"]
+    )
 
     # dimensions
     assert "dimensions" in cached_datasource["soft7_entity_data"]
     assert isinstance(cached_datasource["soft7_entity_data"]["dimensions"], dict)
-    for name, value in cached_datasource["soft7_entity_data"]["dimensions"].items():
-        assert hasattr(datasource.soft7___dimensions, name)
-        datasource_dimensions_value = getattr(datasource.soft7___dimensions, name)
-
-        assert datasource_dimensions_value == value
+    assert (
+        datasource.soft7___dimensions.model_dump()
+        == cached_datasource["soft7_entity_data"]["dimensions"]
+    )
 
     # Create a new data source with the exact same configurations
     new_datasource = create_datasource(
         entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
+        configs=dict(soft_datasource_pipeline_configs),
         oteapi_url="python",
     )
 
     assert CACHE, json.dumps(CACHE, indent=2)
     assert len(CACHE) == 1, json.dumps(CACHE, indent=2)
 
+    # The cached pipeline result has been reused
+    assert {
+        pipeline_id: id(result) for pipeline_id, result in CACHE.items()
+    } == org_cache
+
     # While the pipeline data is the same, the data source instances are different
     assert new_datasource != datasource
     assert new_datasource.soft7___identity == datasource.soft7___identity
@@ -796,9 +357,7 @@ def test_pipeline_cache(
         json={
             "dataresource": {
                 "mediaType": "application/yaml",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
+                "downloadUrl": soft_datasource_content_url,
                 "resourceType": "resource/url",
             },
             "mapping": {
@@ -821,6 +380,11 @@ def test_pipeline_cache(
     assert CACHE, json.dumps(CACHE, indent=2)
     assert len(CACHE) == 1, json.dumps(CACHE, indent=2)
 
+    # The cached pipeline result has been reused
+    assert {
+        pipeline_id: id(result) for pipeline_id, result in CACHE.items()
+    } == org_cache
+
     # While the pipeline data is the same, the data source instances are different
     assert new_new_datasource != new_datasource != datasource
     assert (
@@ -856,15 +420,12 @@ def test_no_mapping_config(soft_entity_init: dict[str, str | dict]) -> None:
         )
 
 
+@pytest.mark.usefixtures("clear_datasource_cache")
 def test_bad_pipeline_response(
     soft_entity_init: dict[str, str | dict],
-    soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    requests_mock: Mocker,
-    httpx_mock: HTTPXMock,
-    static_folder: Path,
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+    soft7_function_get_content: dict[str, Any],
+    mock_oteapi_service: Callable[[dict[str, Any]], None],
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test an error is raised if the pipeline response is not as expected.
@@ -872,113 +433,19 @@ def test_bad_pipeline_response(
     Need to go the route of mocking an OTEAPI Service, not using `python`, as this
     is the easiest way to mock a bad pipeline response.
     """
-    import json
-
-    from otelib.settings import Settings
+    from copy import deepcopy
 
     from s7.factories.datasource_factory import create_datasource
-    from s7.oteapi_plugin.soft7_function import SOFT7Generator
-
-    default_oteapi_url = "http://localhost:8080"
-    rest_api_prefix = Settings().prefix
-
-    oteapi_url = f"{default_oteapi_url}{rest_api_prefix}"
-
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
 
-    # Run SOFT7Generator
-    # Mock the session data content for the
-    # pipeline = dataresource >> mapping >> function
-    session_data = {}
-    session_data.update(soft_datasource_entity_mapping_init)
-    session_data.update({"content": soft_datasource_init})
-    generator_configuration = {"entity": soft_entity_init["identity"]}
-    function_get_content = SOFT7Generator(
-        function_config={
-            "functionType": "SOFT7",
-            "configuration": {**session_data, **generator_configuration},
-        }
-    ).get()
+    function_get_content = deepcopy(soft7_function_get_content)
 
     # Change the key of the 'function_get_content' to simulate a bad response
     assert "soft7_entity_data" in function_get_content
     function_get_content["wrong_key"] = function_get_content.pop("soft7_entity_data")
     assert "soft7_entity_data" not in function_get_content
 
-    # Creating strategies
-    # The data resource
-    requests_mock.post(
-        f"{oteapi_url}/dataresource",
-        json={"resource_id": "1234"},
-    )
-
-    # The parser resource
-    requests_mock.post(
-        f"{oteapi_url}/parser",
-        json={"parser_id": "1234"},
-    )
-
-    # The mapping
-    requests_mock.post(
-        f"{oteapi_url}/mapping",
-        json={"mapping_id": "1234"},
-    )
-
-    # The function
-    requests_mock.post(
-        f"{oteapi_url}/function",
-        json={"function_id": "1234"},
-    )
-
-    # Getting the OTE pipeline = dataresource >> mapping >> function
-    # Create session
-    requests_mock.post(
-        f"{oteapi_url}/session",
-        text=json.dumps({"session_id": "1234"}),
-    )
-
-    # Initialize
-    requests_mock.post(
-        f"{oteapi_url}/function/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/mapping/1234/initialize",
-        content=json.dumps(soft_datasource_entity_mapping_init).encode(
-            encoding="utf-8"
-        ),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/parser/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/dataresource/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-
-    # Fetch
-    requests_mock.get(
-        f"{oteapi_url}/dataresource/1234",
-        content=json.dumps({"key": "test"}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/parser/1234",
-        content=json.dumps({"content": soft_datasource_init}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/mapping/1234",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/function/1234",
-        content=function_get_content.model_dump_json().encode(encoding="utf-8"),
-    )
+    # Mock the OTEAPI Service running the pipeline
+    mock_oteapi_service(function_get_content)
 
     # Create the data source
     # As it is now, the pipeline will be run to retrieve the dimensions for property
@@ -996,23 +463,7 @@ def test_bad_pipeline_response(
     ):
         create_datasource(
             entity=soft_entity_init,
-            configs={
-                "dataresource": {
-                    "resourceType": "resource/url",
-                    "downloadUrl": (
-                        static_folder / "soft_datasource_content.yaml"
-                    ).as_uri(),
-                    "mediaType": "application/yaml",
-                },
-                "parser": {
-                    "parserType": "parser/yaml",
-                    "entity": soft_entity_init["identity"],
-                },
-                "mapping": {
-                    "mappingType": "triples",
-                    **soft_datasource_entity_mapping_init,
-                },
-            },
+            configs=dict(soft_datasource_pipeline_configs),
         )
 
     # This is the "original" error, reported in the log through the custom
@@ -1027,149 +478,36 @@ def test_bad_pipeline_response(
     assert "An error occurred during attribute resolution:" in caplog.text
 
 
+@pytest.mark.usefixtures("clear_datasource_cache")
 def test_get_nonexisting_property(
     soft_entity_init: dict[str, str | dict],
-    static_folder: Path,
-    soft_datasource_init: dict[str, Any],
-    soft_datasource_entity_mapping_init: dict[
-        str, dict[str, str] | list[tuple[str, str, str]]
-    ],
-    requests_mock: Mocker,
-    httpx_mock: HTTPXMock,
+    soft_datasource_pipeline_configs: dict[str, dict[str, Any]],
+    soft7_function_get_content: dict[str, Any],
+    mock_oteapi_service: Callable[[dict[str, Any]], None],
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test an error is raised when trying to get a non-existing property.
 
     Test an error is raised when trying to get a property that cannot be resolved.
     """
-    import json
-
-    from otelib.settings import Settings
+    from copy import deepcopy
 
     from s7.factories.datasource_factory import create_datasource
-    from s7.oteapi_plugin.soft7_function import SOFT7Generator
-
-    default_oteapi_url = "http://localhost:8080"
-    rest_api_prefix = Settings().prefix
-
-    oteapi_url = f"{default_oteapi_url}{rest_api_prefix}"
-
-    # Mock SOFT7Entity identity URL
-    httpx_mock.add_response(
-        method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
-    )
 
-    # Run SOFT7Generator
-    # Mock the session data content for the
-    # pipeline = dataresource >> mapping >> function
-    session_data = {}
-    session_data.update(soft_datasource_entity_mapping_init)
-    session_data.update({"content": soft_datasource_init})
-    generator_configuration = {"entity": soft_entity_init["identity"]}
-    function_get_content = SOFT7Generator(
-        function_config={
-            "functionType": "SOFT7",
-            "configuration": {**session_data, **generator_configuration},
-        }
-    ).get()
+    function_get_content = deepcopy(soft7_function_get_content)
 
     # Change the content, removing a property to simulate a bad response
     missing_property = function_get_content["soft7_entity_data"]["properties"].popitem()
     # Ensure there are still properties
     assert function_get_content["soft7_entity_data"]["properties"]
 
-    # Creating strategies
-    # The data resource
-    requests_mock.post(
-        f"{oteapi_url}/dataresource",
-        json={"resource_id": "1234"},
-    )
-
-    # The parser resource
-    requests_mock.post(
-        f"{oteapi_url}/parser",
-        json={"parser_id": "1234"},
-    )
-
-    # The mapping
-    requests_mock.post(
-        f"{oteapi_url}/mapping",
-        json={"mapping_id": "1234"},
-    )
-
-    # The function
-    requests_mock.post(
-        f"{oteapi_url}/function",
-        json={"function_id": "1234"},
-    )
-
-    # Getting the OTE pipeline = dataresource >> mapping >> function
-    # Create session
-    requests_mock.post(
-        f"{oteapi_url}/session",
-        text=json.dumps({"session_id": "1234"}),
-    )
-
-    # Initialize
-    requests_mock.post(
-        f"{oteapi_url}/function/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/mapping/1234/initialize",
-        content=json.dumps(soft_datasource_entity_mapping_init).encode(
-            encoding="utf-8"
-        ),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/parser/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.post(
-        f"{oteapi_url}/dataresource/1234/initialize",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-
-    # Fetch
-    requests_mock.get(
-        f"{oteapi_url}/dataresource/1234",
-        content=json.dumps({"key": "test"}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/parser/1234",
-        content=json.dumps({"content": soft_datasource_init}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/mapping/1234",
-        content=json.dumps({}).encode(encoding="utf-8"),
-    )
-    requests_mock.get(
-        f"{oteapi_url}/function/1234",
-        content=function_get_content.model_dump_json().encode(encoding="utf-8"),
-    )
+    # Mock the OTEAPI Service running the pipeline
+    mock_oteapi_service(function_get_content)
 
     # Create the data source
     datasource = create_datasource(
         entity=soft_entity_init,
-        configs={
-            "dataresource": {
-                "resourceType": "resource/url",
-                "downloadUrl": (
-                    static_folder / "soft_datasource_content.yaml"
-                ).as_uri(),
-                "mediaType": "application/yaml",
-            },
-            "parser": {
-                "parserType": "parser/yaml",
-                "entity": soft_entity_init["identity"],
-            },
-            "mapping": {
-                "mappingType": "triples",
-                **soft_datasource_entity_mapping_init,
-            },
-        },
+        configs=dict(soft_datasource_pipeline_configs),
     )
 
     # Try to get a non-existing property
@@ -1212,7 +550,7 @@ def test_get_nonexisting_property(
     ids=["non_existing", "overwrite"],
 )
 def test_try_to_overwrite_metadata_fields(
-    soft_entity_init: dict[str, str | dict],
+    soft_entity_init_mutable: dict[str, str | dict],
     static_folder: Path,
     soft_datasource_entity_mapping_init: dict[
         str, dict[str, str] | list[tuple[str, str, str]]
@@ -1223,12 +561,16 @@ def test_try_to_overwrite_metadata_fields(
 ) -> None:
     """Ensure an error is raised if the entity contains special metadata fields used
     for the DataSource model generation."""
+    from copy import deepcopy
+
     import yaml
 
     from s7.factories.datasource_factory import create_datasource
 
+    mapping_raw = deepcopy(soft_datasource_entity_mapping_init)
+
     # Add a metadata field to the entity
-    soft_entity_init["properties"][metadata_field] = {
+    soft_entity_init_mutable["properties"][metadata_field] = {
         "type": "string",
         "description": (
             "Metadata field that should not be overwritten."
@@ -1237,7 +579,7 @@ def test_try_to_overwrite_metadata_fields(
         ),
     }
     # Extend mapping
-    soft_datasource_entity_mapping_init["triples"].append(
+    mapping_raw["triples"].append(
         (
             f"data_source:properties.{metadata_field}",
             "",
@@ -1258,8 +600,8 @@ def test_try_to_overwrite_metadata_fields(
     # Mock SOFT7Entity identity URL
     httpx_mock.add_response(
         method="GET",
-        url=soft_entity_init["identity"],
-        json=soft_entity_init,
+        url=soft_entity_init_mutable["identity"],
+        json=soft_entity_init_mutable,
     )
 
     # Create the data source
@@ -1271,7 +613,7 @@ def test_try_to_overwrite_metadata_fields(
         ),
     ):
         create_datasource(
-            entity=soft_entity_init,
+            entity=soft_entity_init_mutable,
             configs={
                 "dataresource": {
                     "resourceType": "resource/url",
@@ -1280,11 +622,11 @@ def test_try_to_overwrite_metadata_fields(
                 },
                 "parser": {
                     "parserType": "parser/yaml",
-                    "entity": soft_entity_init["identity"],
+                    "entity": soft_entity_init_mutable["identity"],
                 },
                 "mapping": {
                     "mappingType": "triples",
-                    **soft_datasource_entity_mapping_init,
+                    **mapping_raw,
                 },
             },
             oteapi_url="python",
@@ -134,62 +134,56 @@ def test__flatten_mapping(httpx_mock: HTTPXMock, static_folder: Path) -> None:
     assert isinstance(flat_mapping, list)
     assert len(flat_mapping) == len(mapping_config.triples)
 
+    optimade_namespace = AnyHttpUrl(mapping_config.prefixes["optimade"].rstrip("#"))
+    soft7_namespace = AnyHttpUrl(mapping_config.prefixes["soft7"].rstrip("#"))
+
     expected_flat_mapping = [
         RDFTriple(*_)
         for _ in [
             (
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["optimade"].rstrip("#")
-                    ),
+                    "namespace": optimade_namespace,
                     "concept": "data.id",
                 },
                 {"namespace": "", "concept": ""},
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["soft7"].rstrip("#")
-                    ),
+                    "namespace": soft7_namespace,
                     "concept": "properties.id",
                 },
             ),
             (
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["optimade"].rstrip("#")
-                    ),
+                    "namespace": optimade_namespace,
                     "concept": "data.type",
                 },
                 {"namespace": "", "concept": ""},
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["soft7"].rstrip("#")
-                    ),
+                    "namespace": soft7_namespace,
                     "concept": "properties.type",
                 },
             ),
             (
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["optimade"].rstrip("#")
-                    ),
+                    "namespace": optimade_namespace,
                     "concept": "data.attributes",
                 },
                 {"namespace": "", "concept": ""},
                 {
-                    "namespace": AnyHttpUrl(
-                        mapping_config.prefixes["soft7"].rstrip("#")
-                    ),
+                    "namespace": soft7_namespace,
                     "concept": "properties.attributes",
                 },
             ),
         ]
     ]
 
-    for mapping in flat_mapping:
-        assert mapping in expected_flat_mapping
-        expected_flat_mapping.remove(mapping)
+    # The order of the flattened mapping is not guaranteed (the triples are a set)
+    def _concepts(triple: RDFTriple) -> tuple[str, ...]:
+        """Sort key for a RDF triple: its subject, predicate, and object concepts."""
+        return tuple(part["concept"] for part in triple)
 
-    assert not expected_flat_mapping
+    assert sorted(flat_mapping, key=_concepts) == sorted(
+        expected_flat_mapping, key=_concepts
+    )
 
 
 def _generate_entity_test_cases() -> tuple[
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def name_to_config_type_mapping() -> dict[
     Literal["dataresource", "function", "mapping", "parser"],
     type[
@@ -32,6 +32,7 @@ def name_to_config_type_mapping() -> dict[
         | HashableResourceConfig
     ],
 ]:
+    """A mapping of OTEAPI pipeline config names to their hashable config types."""
     from s7.pydantic_models.oteapi import (
         HashableFunctionConfig,
         HashableMappingConfig,
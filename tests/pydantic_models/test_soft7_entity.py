@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 
 
 def test_entity_shapes_and_dimensions(
-    soft_entity_init: dict[str, Union[str, dict[str, Any]]],
+    soft_entity_init_mutable: dict[str, Union[str, dict[str, Any]]],
 ) -> None:
     """Ensure the validator `shapes_and_dimensions` enforces the desired rules."""
     from s7.pydantic_models.soft7_entity import SOFT7Entity
@@ -44,16 +44,16 @@ def test_entity_shapes_and_dimensions(
         },
     }
 
-    assert soft_entity_init["dimensions"]
-    assert isinstance(soft_entity_init["dimensions"], dict)
+    assert soft_entity_init_mutable["dimensions"]
+    assert isinstance(soft_entity_init_mutable["dimensions"], dict)
 
-    assert soft_entity_init["properties"]
-    assert isinstance(soft_entity_init["properties"], dict)
+    assert soft_entity_init_mutable["properties"]
+    assert isinstance(soft_entity_init_mutable["properties"], dict)
 
-    soft_entity_init["dimensions"].update(additional_dimensions)
-    soft_entity_init["properties"].update(additional_properties)
+    soft_entity_init_mutable["dimensions"].update(additional_dimensions)
+    soft_entity_init_mutable["properties"].update(additional_properties)
 
-    SOFT7Entity(**soft_entity_init)
+    SOFT7Entity(**soft_entity_init_mutable)
 
 
 @pytest.mark.parametrize(